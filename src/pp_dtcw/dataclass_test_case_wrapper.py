@@ -1,9 +1,20 @@
-import pytest
-from typing import Any
-from _pytest.mark import ParameterSet  # Need for ParameterSet type hinting.
-from _collections_abc import Collection # Need for `marks` type hinting.
+from __future__ import annotations # Type hints are not evaluated at runtime, so their imports are only needed for type checking.
+import dataclasses
+from typing import Any, Callable, TYPE_CHECKING
 import logging
+import weakref
 
+if TYPE_CHECKING: # pytest is imported lazily at runtime, only when an entry with id/marks is built.
+    import pytest
+    from _pytest.mark import ParameterSet  # Need for ParameterSet type hinting.
+    from collections.abc import Collection # Need for `marks` type hinting.
+
+logger = logging.getLogger(__name__)
+_EMPTY_RESULT:tuple[str, tuple[()]] = ("", ()) # Shared result for empty test case lists, so none is allocated per call.
+_layouts:weakref.WeakKeyDictionary[type, tuple[str, Callable[[Any], tuple[Any, ...]]]] = weakref.WeakKeyDictionary() # See `_layout()`.
+_logged_dataclass_types:weakref.WeakSet[type] = weakref.WeakSet() # Dataclass types whose parametrization keys have already been logged.
+
+@dataclasses.dataclass(slots=True)
 class DataclassTestCaseWrapper:
     """
     A class to wrap other classes using the `@dataclass` decorator for pytest test cases.
@@ -18,7 +29,7 @@ class DataclassTestCaseWrapper:
 
         # Create a static method which we'll use to return the processed wrapped dataclass test cases.
         @staticmethod
-        def is_identical_test_cases() -> tuple[str, list[tuple[Any] | ParameterSet]]:
+        def is_identical_test_cases() -> tuple[str, tuple[tuple[Any] | ParameterSet, ...]]:
             # Define the `@dataclass` format we want to use.
             @dataclass # NOTE: `@dataclass` variables REQUIRE type hinting.
             class IsIdenticalTestCase:
@@ -58,64 +69,108 @@ class DataclassTestCaseWrapper:
             is_identical:bool = BST.is_identical(bst_a.root, bst_b.root)
             assert is_identical == expected_bool
     """
-    def __init__(self, dataclass, id:str|None = None, marks:pytest.MarkDecorator|Collection[pytest.MarkDecorator|pytest.Mark] = ()):
-        """Type of `dataclass` is supposed to be unknown: can be any `@dataclass` class."""
-        self.id:str|None = id
-        self.marks:pytest.MarkDecorator|Collection[pytest.MarkDecorator|pytest.Mark] = marks
-        self.dataclass = dataclass
+    dataclass:Any # Type of `dataclass` is supposed to be unknown: can be any `@dataclass` class.
+    id:str|None = None
+    marks:pytest.MarkDecorator|Collection[pytest.MarkDecorator|pytest.Mark] = ()
 
-def _get_all_var_keys(test_case:DataclassTestCaseWrapper) -> str:
-    """Taking a dataclass test case wrapper, gets all variable names in the dataclass.
+def _layout(cls:type) -> tuple[str, Callable[[Any], tuple[Any, ...]]]:
+    """Taking a `@dataclass` class, gets its var names and a getter for its var values.
 
-    :return: Comma-separated string of all var names in the dataclass.
-    """
-    test_cases_dict_keys:list[str] = list(test_case.dataclass.__dict__.keys())
-    return ", ".join(test_cases_dict_keys)
+    Cached per class, as the same dataclass is usually parametrized by many test functions.
+    The cache holds classes weakly, so dataclasses defined locally (e.g. inside a staticmethod) can still be garbage collected.
 
-def _rdy_entry_for_parametrization(test_case:DataclassTestCaseWrapper) -> tuple[Any] | ParameterSet:
+    :return: Tuple of two values: comma-separated string of all var names in the dataclass & callable returning a tuple of all var values of an instance, in field order.
+    """
+    layout:tuple[str, Callable[[Any], tuple[Any, ...]]] | None = _layouts.get(cls)
+    if layout is not None:
+        return layout
+
+    test_case_var_names:tuple[str, ...] = tuple(field.name for field in dataclasses.fields(cls))
+
+    # Generate a getter specialised to this dataclass, e.g. `def get_var_values(dataclass): return (dataclass.a, dataclass.b,)`.
+    # Plain attribute loads into a tuple display beat `operator.attrgetter()`, and the compiled function is cached with the layout.
+    # Field names of a `@dataclass` are always valid identifiers, so they can be pasted into the source as-is.
+    var_value_exprs:str = "".join(f"dataclass.{test_case_var_name}, " for test_case_var_name in test_case_var_names)
+    namespace:dict[str, Any] = {}
+    exec(f"def get_var_values(dataclass): return ({var_value_exprs})", namespace)
+    get_var_values:Callable[[Any], tuple[Any, ...]] = namespace["get_var_values"]
+    layout = (", ".join(test_case_var_names), get_var_values)
+    _layouts[cls] = layout
+    return layout
+
+def _rdy_entry_for_parametrization(test_case:DataclassTestCaseWrapper, get_var_values:Callable[[Any], tuple[Any, ...]], param:Callable[..., ParameterSet]) -> tuple[Any] | ParameterSet:
     """See `rdy_dataclass_entries_for_parametrization()`.
 
     If test case has `.id` or `.marks` field, returned entry will be of type `ParameterSet`, otherwise `tuple`.
-    """
-    test_case_var_values:list[Any] = []
 
-    # Put all values of the dataclass test case into a list.
-    for test_case_var_name in test_case.dataclass.__dict__:
-        test_case_var_val:Any = getattr(test_case.dataclass, test_case_var_name)
-        test_case_var_values.append(test_case_var_val)
+    :param get_var_values: Callable returning a tuple of all var values of the dataclass, in field order.
+    :param param: `pytest.param`, imported once per batch by the caller.
+    """
+    test_case_var_values:tuple[Any, ...] = get_var_values(test_case.dataclass)
 
     # If id OR marks are present, turn parametrization entry into ParameterSet data type.
     # Note: `*values` object for `pytest.param()` must be separate values. E.g. `pyest.param(1, 2, 3)` or `pytest.param(*[1, 2, 3])`.
     if test_case.id or test_case.marks:
-        if not (test_case.id): # No id means ONLY marks are present.
-            ParameterSet_for_parametrization:ParameterSet = pytest.param(*test_case_var_values, marks=test_case.marks)
-        elif not (test_case.marks): # No marks means ONLY id is present.
-            ParameterSet_for_parametrization:ParameterSet = pytest.param(*test_case_var_values, id=test_case.id)
-        else: # Both id and marks are present.
-            ParameterSet_for_parametrization:ParameterSet = pytest.param(*test_case_var_values, id=test_case.id, marks=test_case.marks)
-
-        return ParameterSet_for_parametrization
+        # `pytest.param()` treats `id=None` and `marks=()` the same as omitting them, and validates both.
+        return param(*test_case_var_values, id=test_case.id or None, marks=test_case.marks or ())
     else: # Return parametrization entry as tuple. Since no id or marks.
-        return tuple(test_case_var_values)
+        return test_case_var_values
 
-def rdy_entries_for_parametrization(test_cases:list[DataclassTestCaseWrapper]) -> tuple[str, list[tuple[Any] | ParameterSet]]:
+def rdy_entries_for_parametrization(test_cases:list[DataclassTestCaseWrapper]) -> tuple[str, tuple[tuple[Any] | ParameterSet, ...]]:
     """For each test case wrapper instance, process data into an entry that is then ready for parametrization with `@pytest.mark.parametrize()`.
 
     :param test_cases: List of DataclassTestCaseWrapper instances.
     :return: Tuple of two values: str containing all variable names in DataclassTestCaseWrapper & for each test case, data entries for parametrization.
     Returns empty tuple if no test cases provided.
+    :raises TypeError: If the test cases do not all wrap the same `@dataclass` class.
+    """
+    return _rdy_entries_for_parametrization(test_cases, logger.isEnabledFor(logging.DEBUG))
+
+def rdy_entries_for_parametrization_many(groups:dict[str, list[DataclassTestCaseWrapper]]) -> dict[str, tuple[str, tuple[tuple[Any] | ParameterSet, ...]]]:
+    """Same as `rdy_entries_for_parametrization()`, but for many independent lists of test cases at once.
+
+    Preferred when e.g. a conftest prepares parametrizations for many test functions: the logging check is done once for all groups.
+
+    :param groups: Dict of group name (e.g. test function name) to list of DataclassTestCaseWrapper instances.
+    :return: Dict of group name to its `rdy_entries_for_parametrization()` result.
+    :raises TypeError: If the test cases of a group do not all wrap the same `@dataclass` class.
+    """
+    log_entries:bool = logger.isEnabledFor(logging.DEBUG)
+    return {name: _rdy_entries_for_parametrization(test_cases, log_entries) for name, test_cases in groups.items()}
+
+def _rdy_entries_for_parametrization(test_cases:list[DataclassTestCaseWrapper], log_entries:bool) -> tuple[str, tuple[tuple[Any] | ParameterSet, ...]]:
+    """See `rdy_entries_for_parametrization()`.
+
+    :param log_entries: Whether debug logging is enabled. Checked once by the caller, so disabled logging costs nothing per entry.
     """
     if len(test_cases) == 0:
-        logging.warning("No dataclass test cases provided for parametrization.")
-        return ("", [])
-    entries_for_parametrization:list[tuple[Any] | ParameterSet] = [] # List containing processed entries at end, ready to be passed into `@pytest.mark.parametrize()`.
-    test_cases_dict_keys_joined:str = _get_all_var_keys(test_cases[0])
-    logging.info(f"Parametrization keys: {test_cases_dict_keys_joined}")
-
-    for i, test_case in enumerate(test_cases):
-        entries_for_parametrization.append(
-            _rdy_entry_for_parametrization(test_case)
-        )
-        logging.info(f"[{i}] vals: {entries_for_parametrization[-1]}")
+        logger.warning("No dataclass test cases provided for parametrization.")
+        return _EMPTY_RESULT
+
+    # All test cases must wrap the same `@dataclass` class, so its layout only needs to be looked up once.
+    # Otherwise argnames and argvalues would silently misalign.
+    dataclass_cls:type = type(test_cases[0].dataclass)
+    for test_case in test_cases:
+        if type(test_case.dataclass) is not dataclass_cls:
+            raise TypeError(f"All test cases must wrap the same dataclass type: expected {dataclass_cls.__name__}, got {type(test_case.dataclass).__name__}.")
+    test_cases_dict_keys_joined, get_var_values = _layout(dataclass_cls)
+    if log_entries and dataclass_cls not in _logged_dataclass_types: # Keys are logged once per dataclass type, not once per call.
+        logger.debug("Parametrization keys for %s: %s", dataclass_cls.__name__, test_cases_dict_keys_joined)
+        _logged_dataclass_types.add(dataclass_cls)
+
+    # If no test case has an id or marks, every entry is a plain tuple; skip the per-case id/marks check for the whole batch.
+    any_id_or_marks:bool = any(test_case.id or test_case.marks for test_case in test_cases)
+
+    # Tuple containing processed entries, ready to be passed into `@pytest.mark.parametrize()`.
+    entries_for_parametrization:tuple[tuple[Any] | ParameterSet, ...]
+    if any_id_or_marks:
+        import pytest # Only needed for entries with id/marks. Already in `sys.modules` when running under pytest.
+        entries_for_parametrization = tuple([_rdy_entry_for_parametrization(test_case, get_var_values, pytest.param) for test_case in test_cases])
+    else:
+        entries_for_parametrization = tuple([get_var_values(test_case.dataclass) for test_case in test_cases])
+
+    if log_entries:
+        for i, entry in enumerate(entries_for_parametrization):
+            logger.debug("entry[%d]: %r", i, entry)
 
     return (test_cases_dict_keys_joined, entries_for_parametrization)
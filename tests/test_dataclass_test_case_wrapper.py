@@ -1,7 +1,9 @@
 import pytest
 import logging
+import gc
+import weakref
 from dataclasses import dataclass # NOTE: `@dataclass` variables REQUIRE type hinting.
-from pp_dtcw.dataclass_test_case_wrapper import DataclassTestCaseWrapper, rdy_entries_for_parametrization
+from pp_dtcw.dataclass_test_case_wrapper import DataclassTestCaseWrapper, rdy_entries_for_parametrization, rdy_entries_for_parametrization_many
 
 class TestWrapper:
     @staticmethod
@@ -45,3 +47,111 @@ class TestWrapper:
     ):
         logging.info(f"id = {request.node.callspec.id}")
         logging.info(f"str_a: {str_a}, int_b: {int_b}, float_c: {float_c}, expected_bool: {expected_bool}")
+
+    def test_local_dataclass_can_be_garbage_collected(self):
+        @dataclass
+        class MyLocalTestCase:
+            int_a: int
+
+        rdy_entries_for_parametrization([DataclassTestCaseWrapper(dataclass=MyLocalTestCase(int_a=1))])
+        dataclass_ref = weakref.ref(MyLocalTestCase)
+        del MyLocalTestCase
+        gc.collect()
+
+        assert dataclass_ref() is None
+
+    def test_heterogeneous_dataclass_types_raise(self):
+        @dataclass
+        class TestCaseA:
+            int_a: int
+
+        @dataclass
+        class TestCaseB:
+            int_a: int
+
+        with pytest.raises(TypeError):
+            rdy_entries_for_parametrization([
+                DataclassTestCaseWrapper(dataclass=TestCaseA(int_a=1)),
+                DataclassTestCaseWrapper(dataclass=TestCaseB(int_a=2)),
+            ])
+
+    def test_entries_with_id_or_marks_match_pytest_param(self):
+        @dataclass
+        class MyTestCase:
+            int_a: int
+            int_b: int
+
+        _, entries = rdy_entries_for_parametrization([
+            DataclassTestCaseWrapper(dataclass=MyTestCase(int_a=1, int_b=2)),
+            DataclassTestCaseWrapper(id="id only", dataclass=MyTestCase(int_a=3, int_b=4)),
+            DataclassTestCaseWrapper(marks=pytest.mark.xfail, dataclass=MyTestCase(int_a=5, int_b=6)),
+            DataclassTestCaseWrapper(id="both", marks=[pytest.mark.skip], dataclass=MyTestCase(int_a=7, int_b=8)),
+        ])
+
+        assert entries == (
+            (1, 2),
+            pytest.param(3, 4, id="id only"),
+            pytest.param(5, 6, marks=pytest.mark.xfail),
+            pytest.param(7, 8, id="both", marks=[pytest.mark.skip]),
+        )
+
+    def test_invalid_id_raises(self):
+        @dataclass
+        class MyTestCase:
+            int_a: int
+
+        with pytest.raises(TypeError):
+            rdy_entries_for_parametrization([DataclassTestCaseWrapper(id=5, dataclass=MyTestCase(int_a=1))])
+
+    def test_usefixtures_mark_raises(self):
+        @dataclass
+        class MyTestCase:
+            int_a: int
+
+        with pytest.raises(ValueError):
+            rdy_entries_for_parametrization([
+                DataclassTestCaseWrapper(marks=pytest.mark.usefixtures("tmp_path"), dataclass=MyTestCase(int_a=1)),
+            ])
+
+    def test_keys_logged_once_per_dataclass_type(self, caplog: pytest.LogCaptureFixture):
+        @dataclass
+        class MyTestCase:
+            int_a: int
+
+        caplog.set_level(logging.DEBUG, logger="pp_dtcw.dataclass_test_case_wrapper")
+        for _ in range(2):
+            rdy_entries_for_parametrization([DataclassTestCaseWrapper(dataclass=MyTestCase(int_a=1))])
+
+        keys_messages = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Parametrization keys")]
+        assert keys_messages == ["Parametrization keys for MyTestCase: int_a"]
+
+    def test_empty_test_cases(self, caplog: pytest.LogCaptureFixture):
+        caplog.set_level(logging.WARNING, logger="pp_dtcw.dataclass_test_case_wrapper")
+        result = rdy_entries_for_parametrization([])
+
+        assert result is rdy_entries_for_parametrization([])
+        assert result == ("", ())
+        assert [record.name for record in caplog.records if record.levelno == logging.WARNING] == ["pp_dtcw.dataclass_test_case_wrapper"] * 2
+
+    def test_many_matches_single(self):
+        @dataclass
+        class MyTestCaseA:
+            int_a: int
+
+        @dataclass
+        class MyTestCaseB:
+            str_a: str
+            str_b: str
+
+        test_cases_a = [
+            DataclassTestCaseWrapper(dataclass=MyTestCaseA(int_a=1)),
+            DataclassTestCaseWrapper(id="2", dataclass=MyTestCaseA(int_a=2)),
+        ]
+        test_cases_b = [
+            DataclassTestCaseWrapper(dataclass=MyTestCaseB(str_a="a", str_b="b")),
+        ]
+
+        assert rdy_entries_for_parametrization_many({"a": test_cases_a, "b": test_cases_b}) == {
+            "a": rdy_entries_for_parametrization(test_cases_a),
+            "b": rdy_entries_for_parametrization(test_cases_b),
+        }